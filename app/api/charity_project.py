@@ -53,6 +53,8 @@ async def create_charity_project(
 ) -> schemas.CharityProjectResponse:
     """Создает новый благотворительный проект.
 
+    Проект записывается и получает свободные пожертвования
+    в одной транзакции.
     Только для суперюзеров.
 
     ### Args:
@@ -72,7 +74,8 @@ async def create_charity_project(
     )
     project = await ch_pr_crud.create(
         new_obj=new_project,
-        session=session
+        session=session,
+        commit=False
     )
     await utils.distribution_of_amounts(
         undivided=project,
@@ -123,7 +126,8 @@ async def update_charity_project(
     project = await ch_pr_crud.update(
         obj=project,
         session=session,
-        update_data=update_data
+        update_data=update_data,
+        commit=False
     )
     await utils.distribution_of_amounts(
         undivided=project,
@@ -1,19 +1,54 @@
 """Эндпоинты для обработки обращений к `Donation`.
 """
-from typing import List
+from typing import List, Tuple
 
 from fastapi import APIRouter, Depends
 
-from app import schemas
+from app import models, schemas
 from app.core import db, user
+from app.core.config import settings
 from app.crud import charity_projects_crud as ch_pr_crud
 from app.crud import donation_crud as dn_crud
 from app.services import constants as const
 from app.services import utils
+from app.services.batcher import MicroBatcher
 
 router = APIRouter()
 
 
+async def create_donations(
+    items: List[Tuple[schemas.DonationCreate, schemas.UserDB]],
+    session: db.AsyncSession
+) -> List[models.Donation]:
+    """Записывает и распределяет пачку пожертвований,
+    собранную из одновременных запросов.
+
+    ### Args:
+    - items (List[Tuple[schemas.DonationCreate, schemas.UserDB]]):
+        Данные пожертвований и сделавшие их пользователи.
+    - session (db.AsyncSession):
+        Объект сессии с БД.
+
+    ### Returns:
+    - List[models.Donation]:
+        Новые учтённые пожертвования в том же порядке.
+    """
+    new_donations, users = zip(*items)
+    return await utils.distribution_of_many(
+        new_objs=list(new_donations),
+        crud_class=dn_crud,
+        reception_crud_class=ch_pr_crud,
+        session=session,
+        users=list(users)
+    )
+
+donation_batcher = MicroBatcher(
+    handler=create_donations,
+    window=settings.donation_batch_window,
+    max_size=settings.donation_batch_size
+)
+
+
 @router.get(
     path='/',
     summary=const.GET_ALL_DONATIONS,
@@ -52,6 +87,11 @@ async def create_donation(
 ) -> schemas.DonationShortResponse:
     """Записывает новое пожертвование.
 
+    Пожертвование записывается и распределяется по открытым проектам
+    в одной транзакции. Пожертвования, поступившие одновременно
+    в пределах окна `donation_batch_window`, записываются
+    и распределяются вместе.
+
     ### Args:
     - new_donation (schemas.DonationCreate):
         Данные для записи нового пожертвования.
@@ -66,10 +106,17 @@ async def create_donation(
     - schemas.DonationShortResponse:
         Новое учтённое пожертвование.
     """
+    if donation_batcher.window > 0:
+        return await donation_batcher.submit(
+            item=(new_donation, user),
+            session=session
+        )
+
     donation = await dn_crud.create(
         new_obj=new_donation,
         session=session,
-        user=user
+        user=user,
+        commit=False
     )
     await utils.distribution_of_amounts(
         undivided=donation,
@@ -80,6 +127,46 @@ async def create_donation(
     return donation
 
 
+@router.post(
+    path='/bulk',
+    summary=const.CREATE_DONATIONS_BULK,
+    response_model=List[schemas.DonationShortResponse],
+    response_model_exclude_none=True
+)
+async def create_donations_bulk(
+    new_donations: List[schemas.DonationCreate],
+    session: db.AsyncSession = Depends(db.get_async_session),
+    user: schemas.UserDB = Depends(user.current_user)
+) -> List[schemas.DonationShortResponse]:
+    """Записывает пачку новых пожертвований.
+
+    Пожертвования записываются одним пакетным запросом и распределяются
+    по открытым проектам в одной транзакции, так же, как если бы
+    они поступили по одному в указанном порядке.
+
+    ### Args:
+    - new_donations (List[schemas.DonationCreate]):
+        Данные для записи новых пожертвований.
+    - session (db.AsyncSession, optional):
+        Объект сессии с БД.
+        Defaults to Depends(db.get_async_session).
+    - user (schemas.UserDB, optional):
+        Данные пользователя, сделавшего пожертвования.
+        Defaults to Depends(user.current_user).
+
+    ### Returns:
+    - List[schemas.DonationShortResponse]:
+        Новые учтённые пожертвования.
+    """
+    return await utils.distribution_of_many(
+        new_objs=new_donations,
+        crud_class=dn_crud,
+        reception_crud_class=ch_pr_crud,
+        session=session,
+        users=[user] * len(new_donations)
+    )
+
+
 @router.get(
     path='/my',
     summary=const.GET_MY_DONATIONS,
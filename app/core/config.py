@@ -16,6 +16,9 @@ class Settings(pd.BaseSettings):
     version: str = '0.0.0'
     database_url: str = 'sqlite+aiosqlite:///./test_project.db'
     secret: str = 'reaLLy L0nG $tr1nG'
+    # for batching of simultaneous donations, 0 disables batching
+    donation_batch_window: float = 0.005  # seconds
+    donation_batch_size: int = 256
     # for auto_create first superuser
     first_superuser_email: Union[None, pd.EmailStr] = None
     first_superuser_password: Union[None, str] = None
@@ -1,9 +1,13 @@
 """Сборник базовых операций CRUD.
 """
-from typing import Any, Generic, List, Type, TypeVar, Union
+from datetime import datetime
+from typing import (Any, AsyncIterator, Generic, List, Tuple, Type, TypeVar,
+                    Union)
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import asc, select
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
 
 from app import schemas
 from app.core import db
@@ -108,36 +112,160 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return some_objs.all()
 
+    def get_distribution_query(
+        self,
+        after: Union[None, Tuple[datetime, int]] = None,
+        chunk_size: int = const.DISTRIBUTION_CHUNK_SIZE
+    ) -> Select:
+        """Составляет запрос порции объектов с незакрытыми инвестициями.
+
+        Объекты идут в порядке очереди (`create_date`, `id`).
+        Для строк считается свободная сумма и нарастающий
+        итог свободных сумм с начала порции.
+
+        ### Args:
+        - after (None | Tuple[datetime, int], optional):
+            Ключ (`create_date`, `id`), после которого начинается порция.
+            Defaults to None.
+        - chunk_size (int, optional):
+            Размер порции.
+            Defaults to const.DISTRIBUTION_CHUNK_SIZE.
+
+        ### Returns:
+        - Select:
+            Запрос со столбцами `id`, `create_date`, `remains`, `cumulative`.
+        """
+        remains = self.model.full_amount - self.model.invested_amount
+        order = (self.model.create_date, self.model.id)
+        query = select(
+            self.model.id,
+            self.model.create_date,
+            remains.label('remains'),
+            func.sum(remains).over(order_by=order).label('cumulative')
+        ).where(
+            self.model.fully_invested.is_(False)
+        )
+        if after is not None:
+            query = query.where(tuple_(*order) > after)
+        return query.order_by(*order).limit(chunk_size)
+
     async def get_for_distribution(
         self,
-        session: db.AsyncSession
-    ) -> Union[ModelType, List[ModelType]]:
-        """Получает все объекты с незакрытыми инвестициями.
+        session: db.AsyncSession,
+        chunk_size: int = const.DISTRIBUTION_CHUNK_SIZE
+    ) -> AsyncIterator[List[Row]]:
+        """Получает объекты с незакрытыми инвестициями порциями.
+
+        Каждая следующая порция запрашивается по ключу последней строки
+        предыдущей и только тогда, когда понадобится.
 
         ### Args:
         - session (db.AsyncSession):
             Объект сесси с БД.
+        - chunk_size (int, optional):
+            Размер порции.
+            Defaults to const.DISTRIBUTION_CHUNK_SIZE.
+
+        ### Yields:
+        - List[Row]:
+            Строки со столбцами `id`, `create_date`, `remains`, `cumulative`.
+        """
+        after = None
+        while True:
+            chunk = (await session.execute(
+                self.get_distribution_query(
+                    after=after,
+                    chunk_size=chunk_size
+                )
+            )).all()
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+            after = (chunk[-1].create_date, chunk[-1].id)
+
+    async def invest(
+        self,
+        amount: int,
+        session: db.AsyncSession
+    ) -> int:
+        """Распределяет сумму по объектам с незакрытыми инвестициями.
+
+        Объекты, чей нарастающий итог укладывается в сумму, закрываются
+        одним запросом, остаток уходит в следующий по очереди объект.
+        Порции объектов запрашиваются только пока сумма не распределена.
+
+        ### Args:
+        - amount (int):
+            Распределяемая сумма.
+        - session (db.AsyncSession):
+            Объект сессии с БД.
 
         ### Returns:
-        - Union[ModelType, List[ModelType]]:
-            Найденные объекты.
+        - int:
+            Распределённая часть суммы.
         """
-        objs = await session.scalars(
-            select(
-                self.model
-            ).where(
-                self.model.fully_invested.is_(False)
-            ).order_by(
-                asc('create_date')
+        invested = 0
+        last_closed = None
+        first_open = None
+
+        if amount > 0:
+            chunks = self.get_for_distribution(session=session)
+            async for chunk in chunks:
+                left = amount - invested
+                closed = 0
+                for row in chunk:
+                    if row.cumulative > left:
+                        first_open = row
+                        break
+                    last_closed = row
+                    closed = row.cumulative
+                invested += closed
+                if first_open is not None or invested == amount:
+                    break
+            await chunks.aclose()
+
+        if last_closed is not None:
+            await session.execute(
+                update(
+                    self.model
+                ).where(
+                    self.model.fully_invested.is_(False),
+                    tuple_(self.model.create_date, self.model.id) <= (
+                        last_closed.create_date, last_closed.id
+                    )
+                ).values(
+                    invested_amount=self.model.full_amount,
+                    fully_invested=True,
+                    close_date=datetime.now()
+                ).execution_options(
+                    synchronize_session=False
+                )
             )
-        )
-        return objs.all()
+        if first_open is not None:
+            await session.execute(
+                update(
+                    self.model
+                ).where(
+                    self.model.id == first_open.id
+                ).values(
+                    invested_amount=(
+                        self.model.invested_amount + amount - invested
+                    )
+                ).execution_options(
+                    synchronize_session=False
+                )
+            )
+            invested = amount
+
+        return invested
 
     async def create(
         self,
         new_obj: CreateSchemaType,
         session: db.AsyncSession,
-        user: Union[None, schemas.UserDB] = None
+        user: Union[None, schemas.UserDB] = None,
+        commit: bool = True
     ) -> ModelType:
         """Создаёт запись в БД.
 
@@ -149,6 +277,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - user (None | schemas.UserDB, optional):
             Пользователь, создавший с запись.
             Defaults to None.
+        - commit (bool, optional):
+            Завершить ли транзакцию. Если нет - объект записывается
+            без фиксации и фиксируется вместе с остальными изменениями.
+            Defaults to True.
 
         ### Returns:
         - ModelType: Объект, записаный в БД.
@@ -160,16 +292,77 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         new_obj = self.model(**new_obj)
         session.add(new_obj)
+        if not commit:
+            await session.flush()
+            return new_obj
         return await utils.try_commit_to_db(
             obj=new_obj,
             session=session
         )
 
+    async def create_many(
+        self,
+        new_objs: List[CreateSchemaType],
+        session: db.AsyncSession,
+        users: Union[None, List[Union[None, schemas.UserDB]]] = None,
+        invested: int = 0
+    ) -> List[ModelType]:
+        """Создаёт записи в БД одним пакетным запросом без фиксации.
+
+        Уже распределённая сумма заполняет объекты по порядку,
+        как если бы они создавались и распределялись по одному.
+
+        `id` новых записей вычисляются по последнему `id` таблицы:
+        пока транзакция держит блокировку записи SQLite, вставленные
+        строки получают идущие подряд `rowid`.
+
+        ### Args:
+        - new_objs (List[CreateSchemaType]):
+            Данные для записи в БД.
+        - session (db.AsyncSession):
+            Объект сессии.
+        - users (None | List[None | schemas.UserDB], optional):
+            Пользователи, создавшие записи, по одному на каждую запись.
+            Defaults to None.
+        - invested (int, optional):
+            Сумма, уже распределённая из новых объектов.
+            Defaults to 0.
+
+        ### Returns:
+        - List[ModelType]:
+            Записанные объекты. В сессию они не добавляются.
+        """
+        now = datetime.now()
+        values = []
+        for number, new_obj in enumerate(new_objs):
+            obj = new_obj.dict()
+            if users is not None and users[number] is not None:
+                obj['user_id'] = users[number].id
+            obj['invested_amount'] = min(obj['full_amount'], invested)
+            obj['fully_invested'] = (
+                obj['invested_amount'] == obj['full_amount']
+            )
+            obj['create_date'] = now
+            obj['close_date'] = now if obj['fully_invested'] else None
+            invested -= obj['invested_amount']
+            values.append(obj)
+
+        if not values:
+            return []
+
+        await session.execute(insert(self.model), values)
+        last_id = await session.scalar(select(func.max(self.model.id)))
+        return [
+            self.model(id=obj_id, **obj)
+            for obj_id, obj in enumerate(values, last_id - len(values) + 1)
+        ]
+
     async def update(
         self,
         obj: ModelType,
         session: db.AsyncSession,
         update_data: UpdateSchemaType,
+        commit: bool = True
     ) -> ModelType:
         """Обновляет запись указанного объекта в БД.
 
@@ -180,6 +373,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Объект сессии с БД.
         - update_data (UpdateSchemaType):
             Обновляемые данные.
+        - commit (bool, optional):
+            Завершить ли транзакцию. Если нет - изменения остаются
+            в сессии и будут записаны вместе с остальными.
+            Defaults to True.
 
         ### Returns:
         - ModelType:
@@ -193,6 +390,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if field in update_data:
                 setattr(obj, field, update_data[field])
 
+        if not commit:
+            return obj
         return await utils.try_commit_to_db(
             obj=obj,
             session=session
@@ -65,3 +65,28 @@ class GenericFields:
         sa.DateTime,
         nullable=True
     )
+
+
+def distribution_index(tablename: str) -> sa.Index:
+    """Создаёт индекс очереди объектов с незакрытыми инвестициями.
+
+    Индекс частичный - только по открытым объектам там,
+    где СУБД это поддерживает.
+
+    ### Args:
+    - tablename (str):
+        Название таблицы.
+
+    ### Returns:
+    - sa.Index:
+        Индекс по (`fully_invested`, `create_date`, `id`).
+    """
+    is_open = sa.column('fully_invested').is_(False)
+    return sa.Index(
+        f'ix_{tablename}_distribution',
+        'fully_invested',
+        'create_date',
+        'id',
+        sqlite_where=is_open,
+        postgresql_where=is_open
+    )
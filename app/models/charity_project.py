@@ -3,7 +3,7 @@
 import sqlalchemy as sa
 
 from app.core import db
-from app.models.base import GenericFields
+from app.models.base import GenericFields, distribution_index
 
 
 class CharityProject(db.Base, GenericFields):
@@ -35,7 +35,7 @@ class CharityProject(db.Base, GenericFields):
         GenericFields.__table_args__ + (sa.CheckConstraint(
             'length(name) BETWEEN 1 AND 100',
             name='invalid length of name'
-        ),)
+        ), distribution_index('charityproject'))
     )
 
     name = sa.Column(
@@ -4,7 +4,7 @@ import fastapi_users_db_sqlalchemy as fa_u_sa
 import sqlalchemy as sa
 
 from app.core import db
-from app.models.base import GenericFields
+from app.models.base import GenericFields, distribution_index
 
 
 class Donation(db.Base, GenericFields):
@@ -32,6 +32,10 @@ class Donation(db.Base, GenericFields):
         Дата, когда вся сумма пожертвования была распределена.
     """
 
+    __table_args__ = (
+        GenericFields.__table_args__ + (distribution_index('donation'),)
+    )
+
     user_id = sa.Column(
         fa_u_sa.GUID,
         sa.ForeignKey('user.id')
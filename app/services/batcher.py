@@ -0,0 +1,112 @@
+"""Объединение одновременных запросов в пачки.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Union
+
+Handler = Callable[[List[Any], Any], Awaitable[List[Any]]]
+
+
+class Batch:
+    """Пачка запросов, собираемая в течение окна ожидания.
+
+    ### Attrs:
+    - items (List[Any]):
+        Данные запросов в порядке поступления.
+    - full (asyncio.Event):
+        Пачка набрала максимальный размер.
+    - results (asyncio.Future):
+        Результаты обработки пачки, по одному на каждый запрос.
+    """
+
+    def __init__(self) -> None:
+        self.items = []
+        self.full = asyncio.Event()
+        self.results = asyncio.get_running_loop().create_future()
+
+
+class MicroBatcher:
+    """Собирает запросы, поступившие в течение окна ожидания,
+    и обрабатывает их одним вызовом обработчика.
+
+    Первый запрос пачки становится ведущим: он ждёт окончания окна
+    или заполнения пачки, вызывает обработчик со своей сессией с БД
+    и раздаёт результаты остальным запросам пачки.
+
+    ### Attrs:
+    - handler (Handler):
+        Корутина, принимающая список данных запросов и сессию с БД
+        и возвращающая список результатов в том же порядке.
+    - window (float):
+        Окно ожидания в секундах.
+    - max_size (int):
+        Максимальный размер пачки.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        window: float,
+        max_size: int
+    ) -> None:
+        self.handler = handler
+        self.window = window
+        self.max_size = max_size
+        self._batch: Union[None, Batch] = None
+
+    async def submit(self, item: Any, session: Any) -> Any:
+        """Добавляет запрос в текущую пачку и ждёт его результат.
+
+        ### Args:
+        - item (Any):
+            Данные запроса.
+        - session (Any):
+            Сессия с БД запроса. Используется, если запрос
+            станет ведущим в пачке.
+
+        ### Returns:
+        - Any:
+            Результат обработки запроса.
+        """
+        batch = self._batch
+        leader = batch is None
+        if leader:
+            batch = self._batch = Batch()
+
+        index = len(batch.items)
+        batch.items.append(item)
+        if len(batch.items) >= self.max_size:
+            self._batch = None
+            batch.full.set()
+
+        if leader:
+            await self._run(batch, session)
+        results = await asyncio.shield(batch.results)
+        return results[index]
+
+    async def _run(self, batch: Batch, session: Any) -> None:
+        """Дожидается заполнения пачки и обрабатывает её.
+
+        ### Args:
+        - batch (Batch):
+            Обрабатываемая пачка.
+        - session (Any):
+            Сессия с БД ведущего запроса.
+        """
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.window)
+            except asyncio.TimeoutError:
+                pass
+            if self._batch is batch:
+                self._batch = None
+            results = await self.handler(batch.items, session)
+        except asyncio.CancelledError:
+            batch.results.cancel()
+            raise
+        except Exception as error:
+            batch.results.set_exception(error)
+        else:
+            batch.results.set_result(results)
+        finally:
+            if self._batch is batch:
+                self._batch = None
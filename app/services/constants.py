@@ -3,6 +3,9 @@
 # to datetime.isoformat
 TIMESPEC = 'seconds'
 
+# for crud.base
+DISTRIBUTION_CHUNK_SIZE = 100
+
 # for core.users
 JWT_LIFE_TIME = 60 * 60   # seconds
 
@@ -17,6 +20,7 @@ DELETE_CHARITY_PROJECTS = 'Удалить благотворительный п
 # names for endpoints in api.donations
 GET_ALL_DONATIONS = 'Просмотреть все пожеотвования'
 CREATE_DONATION = 'Добавить пожертвование'
+CREATE_DONATIONS_BULK = 'Добавить пачку пожертвований'
 GET_MY_DONATIONS = 'Просмотреть все мои пожертвования'
 
 # names for endpoints in api.google
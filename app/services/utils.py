@@ -1,6 +1,9 @@
 """Различные вспомогательные функции.
 """
 from datetime import datetime
+from typing import List, Union
+
+from pydantic import BaseModel
 
 from app.core import db
 from app.services import constants as const
@@ -13,6 +16,10 @@ async def try_commit_to_db(
 ) -> db.Base:
     """Пытается записать данные в БД с обработкой ошибок.
 
+    Объект не перечитывается из БД после записи: значения по умолчанию
+    и `id` он получает при `flush`, остальные поля уже заданы в памяти,
+    поэтому они не сбрасываются при фиксации транзакции.
+
     ### Args:
     - obj (db.Base):
         Объект для записи в БД.
@@ -29,9 +36,9 @@ async def try_commit_to_db(
     - db.Base:
         Записаный а БД объект.
     """
+    session.sync_session.expire_on_commit = False
     try:
         await session.commit()
-        await session.refresh(obj)
         return obj
     except exc.IntegrityError:
         raise exc.HTTPExceptionInternalServerError(
@@ -71,24 +78,15 @@ async def distribution_of_amounts(
         Объект, содержащий поле `full_amount`
         из которого будет производится распределение.
     - crud_class (CRUDBase):
-        Класс, имеющий метод `get_by_field`, возвращающий объекты,
-        в которые возможно распределить сумму.
+        Класс, имеющий метод `invest`, распределяющий сумму
+        по объектам с незакрытыми инвестициями.
     - session (db.AsyncSession):
         Объект сессии с БД.
     """
-    receptions = await crud_class.get_for_distribution(
+    undivided.invested_amount += await crud_class.invest(
+        amount=undivided.full_amount - undivided.invested_amount,
         session=session
     )
-    for reception in receptions:
-        needed = undivided.full_amount - undivided.invested_amount
-        if not needed:
-            break
-        available = reception.full_amount - reception.invested_amount
-        to_add = min(needed, available)
-        reception.invested_amount += to_add
-        undivided.invested_amount += to_add
-        close_obj(reception)
-
     close_obj(undivided)
 
     await try_commit_to_db(
@@ -97,6 +95,55 @@ async def distribution_of_amounts(
     )
 
 
+async def distribution_of_many(
+    new_objs: List[BaseModel],
+    crud_class: db.Base,
+    reception_crud_class: db.Base,
+    session: db.AsyncSession,
+    users: Union[None, List[Union[None, BaseModel]]] = None
+) -> List[db.Base]:
+    """Записывает пачку новых объектов и распределяет их суммы
+    по доступным местам в другие объекты в одной транзакции.
+
+    Результат совпадает с последовательным созданием объектов
+    и распределением каждого через `distribution_of_amounts`:
+    объекты-получатели закрываются по очереди на общую сумму пачки,
+    а распределённая сумма заполняет новые объекты по порядку.
+
+    ### Args:
+    - new_objs (List[BaseModel]):
+        Данные новых объектов в порядке поступления.
+    - crud_class (CRUDBase):
+        Класс, имеющий метод `create_many`, записывающий новые объекты.
+    - reception_crud_class (CRUDBase):
+        Класс, имеющий метод `invest`, распределяющий сумму
+        по объектам с незакрытыми инвестициями.
+    - session (db.AsyncSession):
+        Объект сессии с БД.
+    - users (None | List[None | BaseModel], optional):
+        Пользователи, создавшие объекты, по одному на каждый объект.
+        Defaults to None.
+
+    ### Returns:
+    - List[db.Base]:
+        Записанные объекты.
+    """
+    invested = await reception_crud_class.invest(
+        amount=sum(new_obj.full_amount for new_obj in new_objs),
+        session=session
+    )
+    created = await crud_class.create_many(
+        new_objs=new_objs,
+        session=session,
+        users=users,
+        invested=invested
+    )
+    return await try_commit_to_db(
+        obj=created,
+        session=session
+    )
+
+
 def normalize_datetime(values: dict) -> dict:
     """Изменяет строковый формат даты в формат `ISO`.
 
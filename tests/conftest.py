@@ -9,7 +9,7 @@ from fastapi.testclient import TestClient
 from fastapi_users import models
 from fastapi_users.password import PasswordHelper
 from mixer.backend.sqlalchemy import Mixer as _mixer
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.schemas.user import UserCreate
@@ -184,6 +184,23 @@ def superuser_client():
         yield client
 
 
+@pytest.fixture
+def statements():
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    def commit(conn):
+        executed.append('COMMIT')
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine.sync_engine, 'commit', commit)
+    yield executed
+    event.remove(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.remove(engine.sync_engine, 'commit', commit)
+
+
 @pytest.fixture
 def mixer():
     engine = create_engine('sqlite:///./test.db')
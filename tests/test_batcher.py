@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from app.services.batcher import MicroBatcher
+
+
+def make_batcher(window, max_size):
+    calls = []
+
+    async def handler(items, session):
+        calls.append((list(items), session))
+        if 'error' in items:
+            raise ValueError('error in batch')
+        return [item * 10 for item in items]
+
+    return MicroBatcher(handler, window=window, max_size=max_size), calls
+
+
+async def test_simultaneous_requests_are_coalesced():
+    batcher, calls = make_batcher(window=0.05, max_size=256)
+    results = await asyncio.gather(*(
+        batcher.submit(item=number, session=f'session_{number}')
+        for number in range(1, 6)
+    ))
+    assert results == [10, 20, 30, 40, 50], (
+        'Каждый запрос должен получить свой результат.'
+    )
+    assert calls == [([1, 2, 3, 4, 5], 'session_1')], (
+        'Одновременные запросы должны обрабатываться одной пачкой '
+        'в сессии первого запроса.'
+    )
+
+
+async def test_full_batch_is_processed_without_waiting():
+    batcher, calls = make_batcher(window=10, max_size=2)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(
+            batcher.submit(item=number, session=None)
+            for number in range(1, 5)
+        )),
+        timeout=1
+    )
+    assert results == [10, 20, 30, 40]
+    assert [items for items, _ in calls] == [[1, 2], [3, 4]]
+
+
+async def test_error_is_raised_for_every_request_in_batch():
+    batcher, _ = make_batcher(window=0.05, max_size=256)
+    results = await asyncio.gather(
+        batcher.submit(item=1, session=None),
+        batcher.submit(item='error', session=None),
+        return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert await batcher.submit(item=2, session=None) == 20, (
+        'После ошибки батчер должен принимать новые запросы.'
+    )
+
+
+@pytest.mark.parametrize('window', [0.001, 0.05])
+async def test_single_request_waits_no_longer_than_window(window):
+    batcher, calls = make_batcher(window=window, max_size=256)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await batcher.submit(item=1, session=None) == 10
+    assert loop.time() - start < window + 0.5
+    assert len(calls) == 1
@@ -108,3 +108,55 @@ def test_get_all_donations(superuser_client, donation):
         'id': 1,
         'invested_amount': 0,
     }], 'При получении списка всех пожертвований тело ответа API отличается от ожидаемого.'
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+def test_create_donations_bulk_matches_one_by_one(
+    superuser, user_client, bulk
+):
+    headers = {'Authorization': f'Bearer {superuser}'}
+    for number, full_amount in enumerate((100, 50, 30), start=1):
+        user_client.post('/charity_project/', json={
+            'name': f'Project_{number}',
+            'description': f'Project_{number}',
+            'full_amount': full_amount,
+        }, headers=headers)
+    donations = [
+        {'full_amount': 70, 'comment': 'donation_1'},
+        {'full_amount': 60},
+        {'full_amount': 40, 'comment': 'donation_3'},
+        {'full_amount': 25},
+    ]
+    if bulk:
+        response = user_client.post('/donation/bulk', json=donations)
+        assert response.status_code == 200, (
+            'При создании пачки пожертвований должен возвращаться '
+            'статус-код 200.'
+        )
+        created = response.json()
+    else:
+        created = [
+            user_client.post('/donation/', json=donation).json()
+            for donation in donations
+        ]
+    for data in created:
+        data.pop('create_date')
+    assert created == [
+        {'id': 1, 'full_amount': 70, 'comment': 'donation_1'},
+        {'id': 2, 'full_amount': 60},
+        {'id': 3, 'full_amount': 40, 'comment': 'donation_3'},
+        {'id': 4, 'full_amount': 25},
+    ]
+    projects = user_client.get('/charity_project/').json()
+    assert [
+        (project['invested_amount'], project['fully_invested'])
+        for project in projects
+    ] == [(100, True), (50, True), (30, True)]
+    stored = user_client.get('/donation/', headers=headers).json()
+    assert [
+        (donation['invested_amount'], donation['fully_invested'])
+        for donation in stored
+    ] == [(70, True), (60, True), (40, True), (10, False)]
+    assert [bool(donation['close_date']) for donation in stored] == [
+        True, True, True, False
+    ]
@@ -1,3 +1,11 @@
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+from app.crud import charity_projects_crud, donation_crud
+
+
 
 def test_donation_move_second_project_first_full(
         user_client,
@@ -61,3 +69,165 @@ def test_donation_create_project_doesnt_exists(superuser_client, donation):
         'все свободные деньги должны ожидать открытия нового проекта. '
         'При создании нового проекта свободные инвестиции должны быть направлены на этот проект.'
     )
+
+
+def test_donation_spreads_over_queue_in_order(superuser, user_client):
+    headers = {'Authorization': f'Bearer {superuser}'}
+    for number, full_amount in enumerate((100, 50, 200, 30), start=1):
+        user_client.post('/charity_project/', json={
+            'name': f'Project_{number}',
+            'description': f'Project_{number}',
+            'full_amount': full_amount,
+        }, headers=headers)
+    response = user_client.post('/donation/', json={'full_amount': 180})
+    assert response.status_code == 200
+    projects = user_client.get('/charity_project/').json()
+    assert [
+        (project['invested_amount'], project['fully_invested'])
+        for project in projects
+    ] == [(100, True), (50, True), (30, False), (0, False)], (
+        'Пожертвование должно закрывать проекты по очереди их создания, '
+        'а остаток направляться в следующий открытый проект.'
+    )
+    assert all(project['close_date'] for project in projects[:2])
+    donation = user_client.get('/donation/', headers=headers).json()[0]
+    assert donation['invested_amount'] == 180
+    assert donation['fully_invested'] is True
+
+
+def test_project_collects_waiting_donations_in_order(superuser, user_client):
+    headers = {'Authorization': f'Bearer {superuser}'}
+    for full_amount in (40, 70, 10):
+        user_client.post('/donation/', json={'full_amount': full_amount})
+    user_client.post('/charity_project/', json={
+        'name': 'Project_1',
+        'description': 'Project_1',
+        'full_amount': 100,
+    }, headers=headers)
+    donations = user_client.get('/donation/', headers=headers).json()
+    assert [
+        (donation['invested_amount'], donation['fully_invested'])
+        for donation in donations
+    ] == [(40, True), (60, False), (0, False)]
+    project = user_client.get('/charity_project/').json()[0]
+    assert project['invested_amount'] == 100
+    assert project['fully_invested'] is True
+
+
+async def test_candidates_are_fetched_in_chunks(mixer, session):
+    for number, full_amount in enumerate((10, 20, 30, 40, 50), start=1):
+        mixer.blend(
+            'app.models.charity_project.CharityProject',
+            name=f'Project_{number}',
+            full_amount=full_amount,
+            invested_amount=0,
+            fully_invested=False,
+        )
+    chunks = [
+        [(row.id, row.remains, row.cumulative) for row in chunk]
+        async for chunk in charity_projects_crud.get_for_distribution(
+            session=session, chunk_size=2
+        )
+    ]
+    assert chunks == [
+        [(1, 10, 10), (2, 20, 30)],
+        [(3, 30, 30), (4, 40, 70)],
+        [(5, 50, 50)],
+    ]
+
+
+def test_donation_spreads_over_several_chunks(
+    superuser, user_client, monkeypatch
+):
+    monkeypatch.setattr(
+        charity_projects_crud,
+        'get_for_distribution',
+        partial(charity_projects_crud.get_for_distribution, chunk_size=2)
+    )
+    headers = {'Authorization': f'Bearer {superuser}'}
+    for number, full_amount in enumerate((10, 20, 30, 40, 50), start=1):
+        user_client.post('/charity_project/', json={
+            'name': f'Project_{number}',
+            'description': f'Project_{number}',
+            'full_amount': full_amount,
+        }, headers=headers)
+    user_client.post('/donation/', json={'full_amount': 75})
+    user_client.post('/donation/', json={'full_amount': 25})
+    projects = user_client.get('/charity_project/').json()
+    assert [project['invested_amount'] for project in projects] == [
+        10, 20, 30, 40, 0
+    ]
+    assert [project['fully_invested'] for project in projects] == [
+        True, True, True, True, False
+    ]
+
+
+@pytest.mark.parametrize('crud, index', [
+    (charity_projects_crud, 'ix_charityproject_distribution'),
+    (donation_crud, 'ix_donation_distribution'),
+])
+@pytest.mark.parametrize('after', [None, (datetime(2019, 8, 24), 1)])
+async def test_distribution_query_uses_index(session, crud, index, after):
+    connection = await session.connection()
+    compiled = crud.get_distribution_query(after=after).compile(
+        dialect=connection.dialect
+    )
+    params = compiled.construct_params()
+    plan = await connection.exec_driver_sql(
+        f'EXPLAIN QUERY PLAN {compiled}',
+        tuple(params[name] for name in compiled.positiontup)
+    )
+    details = [row[-1] for row in plan]
+    assert any(f'USING INDEX {index}' in detail for detail in details), (
+        f'Запрос очереди распределения должен использовать индекс `{index}`.'
+    )
+    assert not any('TEMP B-TREE' in detail for detail in details), (
+        'Запрос очереди распределения не должен сортировать строки.'
+    )
+
+
+def test_create_and_invest_commit_once(superuser, user_client, statements):
+    headers = {'Authorization': f'Bearer {superuser}'}
+    user_client.post('/donation/', json={'full_amount': 30})
+    statements.clear()
+    user_client.post('/charity_project/', json={
+        'name': 'Project_1',
+        'description': 'Project_1',
+        'full_amount': 100,
+    }, headers=headers)
+    assert statements.count('COMMIT') == 1, (
+        'Создание проекта и распределение пожертвований '
+        'должны проходить в одной транзакции.'
+    )
+    statements.clear()
+    user_client.post('/donation/', json={'full_amount': 50})
+    assert statements.count('COMMIT') == 1, (
+        'Создание пожертвования и его распределение '
+        'должны проходить в одной транзакции.'
+    )
+
+
+def test_write_endpoints_do_not_reload_after_commit(
+    superuser, user_client, statements
+):
+    headers = {'Authorization': f'Bearer {superuser}'}
+    requests = (
+        lambda: user_client.post('/charity_project/', json={
+            'name': 'Project_1',
+            'description': 'Project_1',
+            'full_amount': 100,
+        }, headers=headers),
+        lambda: user_client.patch('/charity_project/1', json={
+            'full_amount': 120,
+        }, headers=headers),
+        lambda: user_client.post('/donation/', json={'full_amount': 50}),
+    )
+    for request in requests:
+        statements.clear()
+        response = request()
+        assert response.status_code == 200
+        assert statements[-1] == 'COMMIT', (
+            'После фиксации транзакции объект не должен перечитываться из БД.'
+        )
+    assert response.json()['id'] == 1
+    assert response.json()['create_date']